@@ -1,5 +1,17 @@
-from fastapi import APIRouter, HTTPException, status
-from api.pydantic_models.users_pyda_model import UserSchema
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from fastapi_cache.coder import Coder
+from fastapi_cache.decorator import cache
+from pydantic import ConfigDict, Field, TypeAdapter, ValidationError
+from typing import Annotated, NoReturn
+from uuid import UUID
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
+from api.pydantic_models.users_pyda_model import UserCreateSchema, UserSchema
+from database.engine import get_session
+from database.sqlalchemy_models.users_sqla_model import User
 
 router = APIRouter(
     prefix = "/users",
@@ -7,13 +19,197 @@ router = APIRouter(
     responses = {404: {"description" : "User Not Found"}},
 )
 
+# Validates and serializes a whole list of users in single pydantic-core passes.
+# Built lazily on first use, like UserSchema itself, to keep import time down.
+USER_LIST_ADAPTER = TypeAdapter(list[UserSchema], config=ConfigDict(defer_build=True))
+# Request body adapters. Their schemas are built at import for the OpenAPI request bodies.
+_USER_CREATE_ADAPTER = TypeAdapter(UserCreateSchema)
+# An empty batch would otherwise become INSERT ... DEFAULT VALUES and hit NOT NULL columns
+_USER_CREATE_LIST_ADAPTER = TypeAdapter(Annotated[list[UserCreateSchema], Field(min_length=1)])
+
+def _user_insert_values(user: UserCreateSchema) -> dict:
+    '''
+    Column values for a new plain User row. user_type is the polymorphic
+    discriminator, so it is always set here rather than taken from the client.
+    '''
+    return {**user.model_dump(), "user_type": User.__mapper__.polymorphic_identity}
+
+def _openapi_body(adapter: TypeAdapter) -> dict:
+    '''
+    openapi_extra describing a JSON body validated by hand through adapter.
+    Nested definitions are inlined since the schema is not part of the app's components.
+    '''
+    schema = adapter.json_schema(ref_template="{model}")
+    defs = schema.pop("$defs", {})
+
+    def inline(node):
+        if isinstance(node, dict):
+            if "$ref" in node:
+                rest = {key: value for key, value in node.items() if key != "$ref"}
+                return {**inline(defs[node["$ref"]]), **inline(rest)}
+            return {key: inline(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [inline(value) for value in node]
+        return node
+
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": inline(schema)}}
+        }
+    }
+
+async def _validate_body(request: Request, adapter: TypeAdapter):
+    '''
+    Validate the raw request body in one pass from JSON bytes to models,
+    reporting failures as the same 422 response FastAPI would
+    '''
+    try:
+        return adapter.validate_json(await request.body())
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in exc.errors(include_url=False)]
+        ) from exc
+
+# PostgreSQL SQLSTATE codes for constraint violations on insert
+UNIQUE_VIOLATION = "23505"
+FOREIGN_KEY_VIOLATION = "23503"
+
+def _raise_integrity_error(exc: IntegrityError) -> NoReturn:
+    '''
+    Re-raise a constraint violation from a user insert as a client error
+    '''
+    sqlstate = getattr(exc.orig, "sqlstate", None)
+    if sqlstate == UNIQUE_VIOLATION:
+        raise HTTPException(
+            status_code = status.HTTP_409_CONFLICT,
+            detail = "A user with this email already exists"
+        ) from exc
+    if sqlstate == FOREIGN_KEY_VIOLATION:
+        raise HTTPException(
+            status_code = status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail = "custom_type_definition_id does not reference an existing user type definition"
+        ) from exc
+    raise exc
+
+def _user_cache_key(func, namespace: str = "", *, request = None, response = None, args = (), kwargs = None) -> str:
+    '''
+    Cache key for single-user reads. Only user_id identifies the response;
+    the default builder also hashes the per-request session, so keys never repeat.
+    '''
+    return f"{namespace}:{kwargs['user_id']}"
+
+class JSONResponseCoder(Coder):
+    '''
+    Caches the response body bytes exactly as pydantic-core produced them,
+    so a cache hit is returned as-is without decoding or re-validation
+    '''
+    @classmethod
+    def encode(cls, value: Response) -> bytes:
+        return value.body
+
+    @classmethod
+    def decode(cls, value: bytes) -> Response:
+        return Response(content = value, media_type = "application/json")
+
+# Page size bounds for list endpoints
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+def user_list_query():
+    '''
+    Base SELECT for endpoints returning many users.
+    UserSchema only reads columns, so no relationships are loaded and any lazy
+    load raises, making an N+1 query pattern fail loudly instead of silently.
+    '''
+    return select(User).options(raiseload("*"))
+
+@router.get(
+    "/",
+    response_model = list[UserSchema]
+)
+async def list_users(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+    session: AsyncSession = Depends(get_session)
+):
+    '''
+    Return one page of users, ordered by id
+    '''
+    stmt = user_list_query().order_by(User.id).limit(limit).offset(offset)
+    result = await session.scalars(stmt)
+    users = USER_LIST_ADAPTER.validate_python(result.all(), from_attributes=True)
+    return Response(
+        content = USER_LIST_ADAPTER.dump_json(users),
+        media_type = "application/json"
+    )
+
+@router.get(
+    "/{user_id}",
+    response_model = UserSchema
+)
+@cache(expire = 30, namespace = "users", key_builder = _user_cache_key, coder = JSONResponseCoder)
+async def get_user(user_id: UUID, session: AsyncSession = Depends(get_session)):
+    '''
+    Return a single user, served from the Redis cache when possible
+    '''
+    user = await session.get(User, user_id)
+    if user is None:
+        raise HTTPException(status_code = status.HTTP_404_NOT_FOUND, detail = "User Not Found")
+    return Response(
+        content = UserSchema.model_validate(user).model_dump_json(),
+        media_type = "application/json"
+    )
+
 @router.post(
     "/", 
     response_model = UserSchema, 
-    status_code = status.HTTP_201_CREATED
+    status_code = status.HTTP_201_CREATED,
+    openapi_extra = _openapi_body(_USER_CREATE_ADAPTER)
 )
-async def create_user(user: UserSchema):
+async def create_user(request: Request, session: AsyncSession = Depends(get_session)):
     '''
     Create a new user object in the database
     '''
-    
\ No newline at end of file
+    user = await _validate_body(request, _USER_CREATE_ADAPTER)
+    # RETURNING hands back the fully hydrated row, so no refresh SELECT is needed
+    stmt = (
+        insert(User)
+        .values(**_user_insert_values(user))
+        .returning(User)
+    )
+    try:
+        db_user = (await session.execute(stmt)).scalar_one()
+        await session.commit()
+    except IntegrityError as exc:
+        await session.rollback()
+        _raise_integrity_error(exc)
+    # pydantic-core already produces the JSON, skip FastAPI's re-validation and encoding
+    return Response(
+        content = UserSchema.model_validate(db_user).model_dump_json(),
+        media_type = "application/json",
+        status_code = status.HTTP_201_CREATED
+    )
+
+@router.post(
+    "/batch",
+    response_model = list[UUID],
+    status_code = status.HTTP_201_CREATED,
+    openapi_extra = _openapi_body(_USER_CREATE_LIST_ADAPTER)
+)
+async def create_users(request: Request, session: AsyncSession = Depends(get_session)):
+    '''
+    Create many user objects in a single multi-row INSERT, returning their ids
+    '''
+    users = await _validate_body(request, _USER_CREATE_LIST_ADAPTER)
+    try:
+        result = await session.scalars(
+            insert(User).returning(User.id),
+            [_user_insert_values(user) for user in users]
+        )
+        ids = result.all()
+        await session.commit()
+    except IntegrityError as exc:
+        await session.rollback()
+        _raise_integrity_error(exc)
+    return ids
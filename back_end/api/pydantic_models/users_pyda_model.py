@@ -1,21 +1,38 @@
-from pydantic import BaseModel, Field, ConfigDict, UUID7, Json
+from pydantic import BaseModel, Field, ConfigDict
 from database.sqlalchemy_models.users_sqla_model import UserRole, MilitaryBranch
 from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+class UserCreateSchema(BaseModel):
+    """
+    Request body for creating a user. Server generated columns (id, timestamps)
+    and the polymorphic user_type are filled in by the API, not the client.
+    """
+    model_config = ConfigDict(use_enum_values=True)
+
+    name: str
+    email: str
+    role: UserRole = UserRole.USER
+    is_active: bool = True
+    custom_type_definition_id: UUID | None = None
+    custom_fields: dict[str, Any] = Field(default_factory=dict)
 
 class UserSchema(BaseModel):
+    model_config = ConfigDict(from_attributes=True, defer_build=True, use_enum_values=True)
+
     name: str
     email: str
     role: UserRole
     is_active: bool
     user_type: str
-    custom_type_definition_id: UUID7
-    custom_fields: Json
-    id: UUID7
+    custom_type_definition_id: UUID | None
+    id: UUID
     created_on: datetime
     updated_on: datetime
+    custom_fields: dict[str, Any] | None = Field(default_factory=dict)
 
 class MilitaryUserSchema(UserSchema):
-    id: UUID7
     rank: str
     unit: str
     mos: str
@@ -0,0 +1,4 @@
+"""
+pytest root for the back end. Its presence puts back_end/ on sys.path so tests
+import the app the same way main.py does (api..., database..., settings).
+"""
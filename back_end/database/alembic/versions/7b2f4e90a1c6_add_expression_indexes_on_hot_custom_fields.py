@@ -0,0 +1,30 @@
+"""Add expression indexes on hot custom_fields keys.
+
+Revision ID: 7b2f4e90a1c6
+Revises: 3c9e1b7d52a4
+Create Date: 2026-10-15 10:02:17.204511
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b2f4e90a1c6'
+down_revision: Union[str, Sequence[str], None] = '3c9e1b7d52a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_users_cf_security_clearance', 'users', [sa.text("(custom_fields ->> 'security_clearance')")], unique=False)
+    op.create_index('ix_users_cf_ship_assignment', 'users', [sa.text("(custom_fields ->> 'ship_assignment')")], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_users_cf_ship_assignment', table_name='users')
+    op.drop_index('ix_users_cf_security_clearance', table_name='users')
@@ -0,0 +1,30 @@
+"""Index users.email case-insensitively.
+
+Revision ID: 9d3b6c15f7e2
+Revises: e5a07f3b2d18
+Create Date: 2026-10-15 14:21:06.953184
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d3b6c15f7e2'
+down_revision: Union[str, Sequence[str], None] = 'e5a07f3b2d18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.create_index('ix_users_email_lower', 'users', [sa.text('lower(email)')], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_users_email_lower', table_name='users')
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
@@ -0,0 +1,30 @@
+"""Generate primary keys server side.
+
+Revision ID: c41d8a6e93f0
+Revises: 7b2f4e90a1c6
+Create Date: 2026-10-15 11:34:52.871930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41d8a6e93f0'
+down_revision: Union[str, Sequence[str], None] = '7b2f4e90a1c6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column('user_type_definitions', 'id', server_default=sa.text('gen_random_uuid()'))
+    op.alter_column('users', 'id', server_default=sa.text('gen_random_uuid()'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('users', 'id', server_default=None)
+    op.alter_column('user_type_definitions', 'id', server_default=None)
@@ -0,0 +1,31 @@
+"""Switch primary key defaults to UUIDv7.
+
+Revision ID: e5a07f3b2d18
+Revises: c41d8a6e93f0
+Create Date: 2026-10-15 12:08:13.402776
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a07f3b2d18'
+down_revision: Union[str, Sequence[str], None] = 'c41d8a6e93f0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # uuidv7() is built in from PostgreSQL 18
+    op.alter_column('user_type_definitions', 'id', server_default=sa.text('uuidv7()'))
+    op.alter_column('users', 'id', server_default=sa.text('uuidv7()'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('users', 'id', server_default=sa.text('gen_random_uuid()'))
+    op.alter_column('user_type_definitions', 'id', server_default=sa.text('gen_random_uuid()'))
@@ -1,15 +1,33 @@
-from sqlalchemy import create_engine
-from dotenv import load_dotenv
-import os
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from functools import lru_cache
+from typing import AsyncIterator
+from settings import get_settings
 
-load_dotenv()
+@lru_cache
+def get_engine() -> AsyncEngine:
+    '''
+    Engine is created on first use, once per process
+    '''
+    settings = get_settings()
+    # Pool sized for concurrent request handling. Pre-ping drops connections the server
+    # closed while idle, recycle retires them before common idle timeouts, and LIFO
+    # keeps reusing the most recently returned (warm) connections.
+    return create_async_engine(
+        settings.dsn,
+        pool_size = settings.db_pool_size,
+        max_overflow = settings.db_max_overflow,
+        pool_pre_ping = True,
+        pool_recycle = 1800,
+        pool_use_lifo = True
+    )
 
-db_host = os.getenv("DB_HOST")
-db_port = os.getenv("DB_PORT")
-db_user = os.getenv("DB_USER")
-db_password = os.getenv("DB_PASSWORD")
-db_name = os.getenv("DB_NAME")
+@lru_cache
+def get_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(get_engine(), expire_on_commit=False)
 
-engine = create_engine(
-    f"postgresql+psycopg://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
-)
\ No newline at end of file
+async def get_session() -> AsyncIterator[AsyncSession]:
+    '''
+    FastAPI dependency yielding one session per request
+    '''
+    async with get_sessionmaker()() as session:
+        yield session
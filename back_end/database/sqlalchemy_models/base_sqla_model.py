@@ -2,7 +2,6 @@ from sqlalchemy import Column, DateTime
 from sqlalchemy.orm import DeclarativeBase, declared_attr
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
-import uuid
 
 # Base class declaration used by all models
 class Base(DeclarativeBase):
@@ -37,10 +36,13 @@ class BaseModel(Base, TimeStampMixin):
     '''
     __abstract__ = True
 
+    # Generated by PostgreSQL (18+) and handed back through INSERT ... RETURNING.
+    # UUIDv7 is time ordered, so new keys land on the right edge of the B-tree
+    # instead of splitting random pages, and matches the API's UUID7 type.
     id = Column(
         UUID(as_uuid=True), 
         primary_key=True, 
-        default=uuid.uuid4,
+        server_default=func.uuidv7(),
         nullable=False
     )
 
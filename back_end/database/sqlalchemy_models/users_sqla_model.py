@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, Enum as SQLEnum, ForeignKey, Text, DateTime
+from sqlalchemy import Column, String, Boolean, Enum as SQLEnum, ForeignKey, Text, DateTime, Index, cast, func, update
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm.attributes import flag_modified
@@ -14,6 +14,9 @@ class UserRole(enum.Enum):
     ADMIN = "admin"
     USER = "user"
 
+# Database labels for UserRole, computed once rather than inside the column definition
+_USER_ROLE_VALUES = [e.value for e in UserRole]
+
 
 class UserTypeDefinition(BaseModel):
     """
@@ -60,6 +63,17 @@ class UserTypeDefinition(BaseModel):
     # Relationships
     users = relationship("User", back_populates="custom_type_definition")
     
+    # GIN index over the schema document; jsonb_path_ops only supports
+    # containment (@>) but is much smaller and faster than the default jsonb_ops
+    __table_args__ = (
+        Index(
+            "ix_user_type_definitions_field_schema_gin",
+            field_schema,
+            postgresql_using="gin",
+            postgresql_ops={"field_schema": "jsonb_path_ops"}
+        ),
+    )
+    
     def __repr__(self):
         return f"<UserTypeDefinition(id={self.id}, name='{self.name}')>"
     
@@ -78,11 +92,12 @@ class User(BaseModel):
     
     # Core user attributes
     name = Column(String(255), nullable=False)
-    email = Column(String(255), unique=True, nullable=False, index=True)
+    # Uniqueness is enforced case-insensitively by ix_users_email_lower
+    email = Column(String(255), nullable=False)
     
     # System role (for app permissions via Authentik)
     role = Column(
-    SQLEnum(UserRole, values_callable=lambda x: [e.value for e in x]),
+    SQLEnum(UserRole, values_callable=lambda _: _USER_ROLE_VALUES),
     nullable=False,
     default=UserRole.USER
     )
@@ -114,15 +129,35 @@ class User(BaseModel):
     # Relationships
     custom_type_definition = relationship("UserTypeDefinition", back_populates="users")
     
-    assessments_as_tester = relationship(
-        "Assessment", 
-        foreign_keys="Assessment.tester_id", 
-        back_populates="tester"
-    )
-    assessments_as_evaluator = relationship(
-        "Assessment", 
-        foreign_keys="Assessment.evaluator_id", 
-        back_populates="evaluator"
+    # Enable once the Assessment model exists (see sqlalchemy_models/__init__.py);
+    # until then these break mapper configuration for every User query.
+    # assessments_as_tester = relationship(
+    #     "Assessment", 
+    #     foreign_keys="Assessment.tester_id", 
+    #     back_populates="tester"
+    # )
+    # assessments_as_evaluator = relationship(
+    #     "Assessment", 
+    #     foreign_keys="Assessment.evaluator_id", 
+    #     back_populates="evaluator"
+    # )
+    
+    # GIN index for custom field lookups. Only containment queries can use it:
+    #     User.custom_fields.contains({"security_clearance": "Top Secret"})  -> custom_fields @> '{...}'
+    # Key access such as custom_fields -> 'key' or custom_fields ->> 'key' will not hit this index.
+    #
+    # Keys that are filtered on constantly get their own (much smaller) B-tree
+    # expression index instead; query them with User.custom_field_equals().
+    __table_args__ = (
+        Index(
+            "ix_users_custom_fields_gin",
+            custom_fields,
+            postgresql_using="gin",
+            postgresql_ops={"custom_fields": "jsonb_path_ops"}
+        ),
+        Index("ix_users_cf_security_clearance", custom_fields["security_clearance"].astext),
+        Index("ix_users_cf_ship_assignment", custom_fields["ship_assignment"].astext),
+        Index("ix_users_email_lower", func.lower(email), unique=True),
     )
     
     # Polymorphic configuration
@@ -139,20 +174,51 @@ class User(BaseModel):
         """Convenience property to check admin status"""
         return self.role == UserRole.ADMIN
     
+    @classmethod
+    def email_equals(cls, email: str):
+        """
+        Case-insensitive email filter, matches the ix_users_email_lower index
+        """
+        return func.lower(cls.email) == email.lower()
+    
+    @classmethod
+    def custom_field_equals(cls, field_name: str, value: str):
+        """
+        Filter expression for custom_fields ->> field_name = value.
+        Matches the ix_users_cf_* expression indexes for hot keys.
+        """
+        return cls.custom_fields[field_name].astext == value
+    
     def get_custom_field(self, field_name: str, default=None):
         """Safely retrieve a custom field value"""
         if self.custom_fields is not None:
             return self.custom_fields.get(field_name, default)
         return default
 
-def set_custom_field(self, field_name: str, value):
-    """Set a custom field value"""
-    if self.custom_fields is None:
-        self.custom_fields = {}
-    fields = dict(self.custom_fields)  # Create a new dict
-    fields[field_name] = value
-    self.custom_fields = fields
-    flag_modified(self, 'custom_fields')
+    def set_custom_field(self, field_name: str, value):
+        """Set a custom field value"""
+        if self.custom_fields is None:
+            self.custom_fields = {}
+        # Mutate in place; flag_modified makes SQLAlchemy write the column anyway
+        self.custom_fields[field_name] = value
+        flag_modified(self, 'custom_fields')
+    
+    @classmethod
+    def merge_custom_fields(cls, values: dict, *criteria):
+        """
+        UPDATE statement merging values into custom_fields server side (custom_fields || values)
+        for every user matching criteria, without loading any rows.
+        At least one criterion is required so a missing filter cannot rewrite every user.
+        """
+        if not criteria:
+            raise ValueError("merge_custom_fields requires at least one WHERE criterion")
+        return (
+            update(cls)
+            .where(*criteria)
+            .values(
+                custom_fields=func.coalesce(cls.custom_fields, cast({}, JSONB)).op("||")(cast(values, JSONB))
+            )
+        )
 
 
 class MilitaryBranch(enum.Enum):
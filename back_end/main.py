@@ -1,9 +1,24 @@
 # Required Imports
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.redis import RedisBackend
+from redis import asyncio as aioredis
 import uvicorn
+from api.pydantic_models.routes.users_routes import router as users_router
+from settings import get_settings
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Response cache shared by all workers
+    redis = aioredis.from_url(get_settings().redis_url)
+    FastAPICache.init(RedisBackend(redis), prefix = "angry-platypus")
+    yield
+    await redis.aclose()
 
 # Create an instance of the FastAPI class
-app = FastAPI()
+app = FastAPI(lifespan = lifespan)
+app.include_router(users_router)
 
 # Define a route with an endpoint
 @app.get("/")
@@ -13,9 +28,15 @@ async def root():
     }
 
 if __name__ == "__main__":
+    # Auto-reload is for development only and cannot be combined with multiple workers
+    settings = get_settings()
+    reload = settings.uvicorn_reload
     uvicorn.run(
         "main:app", 
         host = "127.0.0.1", 
         port = 8080, 
-        reload = True
+        workers = 1 if reload else settings.uvicorn_workers,
+        loop = "uvloop",
+        http = "httptools",
+        reload = reload
     )
\ No newline at end of file
@@ -0,0 +1,64 @@
+from functools import lru_cache
+from pathlib import Path
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from sqlalchemy import URL
+import os
+
+BACK_END_DIR = Path(__file__).resolve().parent
+
+# .env locations, lowest priority first. back_end/database/.env is the file Alembic's
+# env.py loads, so the app and migrations share one configuration.
+ENV_FILES = (
+    BACK_END_DIR.parent / ".env",
+    BACK_END_DIR / ".env",
+    BACK_END_DIR / "database" / ".env",
+)
+
+class Settings(BaseSettings):
+    '''
+    Application configuration, read from the environment or a .env file
+    '''
+    model_config = SettingsConfigDict(env_file=ENV_FILES, extra="ignore")
+
+    # Database
+    db_host: str
+    db_port: int
+    db_user: str
+    db_password: str
+    db_name: str
+
+    # Connection pool, per worker process. Every uvicorn worker opens its own pool, so
+    # the server can hold up to uvicorn_workers * (db_pool_size + db_max_overflow)
+    # connections; keep that below PostgreSQL's max_connections (100 by default).
+    db_pool_size: int = 5
+    db_max_overflow: int = 5
+
+    # Response cache
+    redis_url: str = "redis://localhost:6379"
+
+    # Server
+    uvicorn_workers: int = Field(default_factory=lambda: os.cpu_count() or 1)
+    uvicorn_reload: bool = False
+
+    @property
+    def dsn(self) -> URL:
+        '''
+        Async SQLAlchemy connection URL for the application database.
+        URL.create keeps credentials containing @, / or : intact.
+        '''
+        return URL.create(
+            drivername="postgresql+asyncpg",
+            username=self.db_user,
+            password=self.db_password,
+            host=self.db_host,
+            port=self.db_port,
+            database=self.db_name
+        )
+
+@lru_cache
+def get_settings() -> Settings:
+    '''
+    Settings are loaded and validated once per process
+    '''
+    return Settings()
@@ -0,0 +1,161 @@
+"""
+Route tests for /users, run against the real mappers and schemas with the
+database session replaced by an in-memory stand-in.
+"""
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import configure_mappers
+
+from database.engine import get_session
+from database.sqlalchemy_models.users_sqla_model import User, UserRole
+from main import app
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+    def scalar_one(self):
+        (row,) = self.rows
+        return row
+
+
+class FakeSession:
+    """Stands in for AsyncSession, recording statements and returning canned rows"""
+
+    def __init__(self):
+        self.rows = []
+        self.error = None
+        self.statements = []
+        self.committed = False
+        self.rolled_back = False
+
+    async def execute(self, stmt, params=None):
+        self.statements.append(stmt)
+        if self.error is not None:
+            raise self.error
+        return FakeResult(self.rows)
+
+    scalars = execute
+
+    async def commit(self):
+        self.committed = True
+
+    async def rollback(self):
+        self.rolled_back = True
+
+
+class UniqueViolation(Exception):
+    sqlstate = "23505"
+
+
+def make_user(**overrides):
+    now = datetime.now(timezone.utc)
+    values = {
+        "id": uuid4(),
+        "name": "Jean-Luc Picard",
+        "email": "picard@example.com",
+        "role": UserRole.USER,
+        "is_active": True,
+        "user_type": "user",
+        "custom_type_definition_id": None,
+        "custom_fields": None,
+        "created_on": now,
+        "updated_on": now,
+    }
+    values.update(overrides)
+    return User(**values)
+
+
+def compiled_params(stmt):
+    return stmt.compile(dialect=postgresql.dialect()).params
+
+
+@pytest.fixture
+def session():
+    return FakeSession()
+
+
+@pytest.fixture
+def client(session):
+    app.dependency_overrides[get_session] = lambda: session
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def test_user_mappers_configure():
+    configure_mappers()
+
+
+def test_list_users_returns_a_page(client, session):
+    user = make_user()
+    session.rows = [user]
+
+    response = client.get("/users/", params={"limit": 10, "offset": 20})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [row["id"] for row in body] == [str(user.id)]
+    assert body[0]["role"] == "user"
+    assert body[0]["custom_fields"] is None
+    sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    assert "LIMIT" in sql and "OFFSET" in sql
+
+
+def test_list_users_rejects_oversized_page(client):
+    response = client.get("/users/", params={"limit": 100000})
+
+    assert response.status_code == 422
+
+
+def test_create_user_sets_user_type_on_server(client, session):
+    session.rows = [make_user(email="riker@example.com")]
+
+    response = client.post(
+        "/users/",
+        json={"name": "William Riker", "email": "riker@example.com", "user_type": "garbage"}
+    )
+
+    assert response.status_code == 201
+    assert response.json()["email"] == "riker@example.com"
+    assert compiled_params(session.statements[0])["user_type"] == "user"
+    assert session.committed
+
+
+def test_create_user_reports_missing_fields_as_body_errors(client, session):
+    response = client.post("/users/", json={"email": "data@example.com"})
+
+    assert response.status_code == 422
+    assert ["body", "name"] in [error["loc"] for error in response.json()["detail"]]
+    assert session.statements == []
+
+
+def test_create_user_maps_duplicate_email_to_conflict(client, session):
+    session.error = IntegrityError("INSERT INTO users", {}, UniqueViolation())
+
+    response = client.post("/users/", json={"name": "Worf", "email": "worf@example.com"})
+
+    assert response.status_code == 409
+    assert session.rolled_back
+
+
+def test_create_users_rejects_empty_batch(client, session):
+    response = client.post("/users/batch", json=[])
+
+    assert response.status_code == 422
+    assert session.statements == []
+
+
+def test_openapi_describes_create_bodies(client):
+    paths = client.get("/openapi.json").json()["paths"]
+
+    assert "requestBody" in paths["/users/"]["post"]
+    assert "requestBody" in paths["/users/batch"]["post"]